@@ -4,27 +4,94 @@ A comprehensive calculator implementing number systems, set operations,
 searching, and sorting algorithms with modern, interactive UI.
 """
 
+import functools
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-from number_systems import NumberSystemConverter
-from set_operations import SetOperations
-from searching import SearchingAlgorithms
-from sorting import SortingAlgorithms
-import time
+
+
+# Combobox labels for the supported number bases
+BASE_MAP = {"2 (Binary)": 2, "8 (Octal)": 8, "10 (Decimal)": 10, "16 (Hexadecimal)": 16}
+BASE_CHOICES = list(BASE_MAP)
+
+# Result banners and section separator shared by the result handlers
+_SEP = "━" * 40 + "\n"
+_CONV_HEADER = (
+    "╔════════════════════════════════════════╗\n"
+    "║  NUMBER SYSTEM CONVERSION RESULT      ║\n"
+    "╚════════════════════════════════════════╝\n\n"
+)
+_SET_HEADER = (
+    "╔════════════════════════════════════════╗\n"
+    "║      SET OPERATION RESULT              ║\n"
+    "╚════════════════════════════════════════╝\n\n"
+)
+_SEARCH_HEADER = (
+    "╔════════════════════════════════════════╗\n"
+    "║      SEARCH ALGORITHM RESULT          ║\n"
+    "╚════════════════════════════════════════╝\n\n"
+)
+_SORT_HEADER = (
+    "╔════════════════════════════════════════╗\n"
+    "║      SORTING ALGORITHM RESULT         ║\n"
+    "╚════════════════════════════════════════╝\n\n"
+)
+
+# Array items may be separated by commas, whitespace, or both
+_SPLIT_RE = re.compile(r'[\s,]+')
+
+
+def _is_int(token):
+    """Check whether a token is a plain, optionally signed, integer."""
+    digits = token[1:] if token[:1] in ("+", "-") else token
+    return digits.isdecimal()
+
+
+def _parse_array(array_str):
+    """Parse array input as integers, falling back to strings."""
+    tokens = [token for token in _SPLIT_RE.split(array_str.strip()) if token]
+    if all(map(_is_int, tokens)):
+        return list(map(int, tokens))
+    return tokens
+
+
+# Longest sorting trace rendered in full; longer ones keep only both ends
+MAX_SHOWN_STEPS = 200
+
+
+def _numbered_steps(render, count, limit=MAX_SHOWN_STEPS):
+    """
+    Yield numbered step lines, eliding the middle of very long traces.
+    
+    render(start, stop) must return the step descriptions in that range,
+    so the elided steps are never formatted.
+    """
+    half = limit // 2
+    if count <= limit:
+        ranges = [(0, count)]
+    else:
+        ranges = [(0, half), (count - half, count)]
+    for start, stop in ranges:
+        if start:
+            yield f"   ...({count - 2 * half} steps omitted)...\n"
+        for i, step in enumerate(render(start, stop), start + 1):
+            yield f"   Step {i}: {step}\n"
 
 
 class ModernButton(tk.Button):
     """Custom button with hover effects."""
     def __init__(self, parent, **kwargs):
         self.original_bg = kwargs.get('bg', '#3498db')
-        self.hover_bg = kwargs.get('hover_bg', self.darken_color(self.original_bg))
+        self.hover_bg = kwargs.get('hover_bg', ModernButton.darken_color(self.original_bg))
         kwargs.pop('hover_bg', None)
         super().__init__(parent, **kwargs)
         self.bind('<Enter>', self.on_enter)
         self.bind('<Leave>', self.on_leave)
         self.bind('<Button-1>', self.on_click)
     
-    def darken_color(self, color):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def darken_color(color):
         """Darken a hex color."""
         if color.startswith('#'):
             rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
@@ -46,6 +113,9 @@ class ModernButton(tk.Button):
 class DiscreteCalculatorApp:
     """Main GUI application for Discrete Structures Calculator."""
     
+    # Tk interpreter whose ttk styles are already configured
+    _styled_interp = None
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Discrete Structures Calculator")
@@ -66,23 +136,26 @@ class DiscreteCalculatorApp:
             'bg': '#f5f7fa'
         }
         
-        # Initialize modules
-        self.number_converter = NumberSystemConverter()
-        self.set_ops = SetOperations()
-        self.search_algo = SearchingAlgorithms()
-        self.sort_algo = SortingAlgorithms()
+        # Algorithm modules are imported on first use so the window shows sooner
+        self.number_converter = None
+        self.set_ops = None
+        self.search_algo = None
+        self.sort_algo = None
         
         self.create_widgets()
         self.setup_style()
     
     def setup_style(self):
-        """Configure ttk styles."""
-        style = ttk.Style()
+        """Configure ttk styles once per Tk interpreter."""
+        if DiscreteCalculatorApp._styled_interp is self.root.tk:
+            return
+        style = ttk.Style(self.root)
         style.theme_use('clam')
         style.configure('TNotebook', background=self.colors['bg'], borderwidth=0)
         style.configure('TNotebook.Tab', padding=[20, 10], font=('Segoe UI', 10, 'bold'))
         style.map('TNotebook.Tab', background=[('selected', self.colors['primary'])], 
                   foreground=[('selected', 'white')])
+        DiscreteCalculatorApp._styled_interp = self.root.tk
     
     def create_widgets(self):
         """Create the main interface widgets."""
@@ -121,11 +194,28 @@ class DiscreteCalculatorApp:
         self.notebook = ttk.Notebook(main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Create tabs
-        self.create_number_systems_tab()
-        self.create_set_operations_tab()
-        self.create_searching_tab()
-        self.create_sorting_tab()
+        # Create tabs; each tab's contents are built the first time it is shown
+        self._pending_tabs = {}
+        tabs = [
+            ("🔢 Number Systems", self.create_number_systems_tab),
+            ("📊 Set Operations", self.create_set_operations_tab),
+            ("🔍 Searching", self.create_searching_tab),
+            ("🔄 Sorting", self.create_sorting_tab)
+        ]
+        for text, builder in tabs:
+            frame = ttk.Frame(self.notebook, padding=0)
+            self.notebook.add(frame, text=text)
+            self._pending_tabs[str(frame)] = (frame, builder)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self._lazy_build)
+        self._lazy_build()
+    
+    def _lazy_build(self, event=None):
+        """Build the selected tab's contents on first view."""
+        pending = self._pending_tabs.pop(self.notebook.select(), None)
+        if pending:
+            frame, builder = pending
+            builder(frame)
     
     def create_card_frame(self, parent, title):
         """Create a modern card-style frame."""
@@ -149,238 +239,166 @@ class DiscreteCalculatorApp:
         
         return card
     
-    def create_number_systems_tab(self):
+    def create_number_systems_tab(self, frame):
         """Create number systems conversion tab."""
-        frame = ttk.Frame(self.notebook, padding=0)
-        self.notebook.add(frame, text="🔢 Number Systems")
-        
-        # Input card
-        input_card = self.create_card_frame(frame, "📥 Input")
-        input_container = tk.Frame(input_card, bg='white')
-        input_container.pack(fill=tk.X, padx=20, pady=15)
-        
-        # Number input
-        tk.Label(input_container, text="Number:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=0, column=0, padx=10, pady=10, sticky="w")
-        self.num_input = tk.Entry(input_container, font=("Segoe UI", 12), width=35, 
-                                  relief=tk.SOLID, bd=1, highlightthickness=2, 
-                                  highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.num_input.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.num_input.bind('<Return>', lambda e: self.convert_number())
-        
-        # From base
-        tk.Label(input_container, text="From Base:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=1, column=0, padx=10, pady=10, sticky="w")
-        self.from_base = ttk.Combobox(input_container, values=["2 (Binary)", "8 (Octal)", "10 (Decimal)", "16 (Hexadecimal)"], 
-                                      state="readonly", width=32, font=("Segoe UI", 11))
-        self.from_base.set("10 (Decimal)")
-        self.from_base.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-        
-        # To base
-        tk.Label(input_container, text="To Base:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=2, column=0, padx=10, pady=10, sticky="w")
-        self.to_base = ttk.Combobox(input_container, values=["2 (Binary)", "8 (Octal)", "10 (Decimal)", "16 (Hexadecimal)"], 
-                                    state="readonly", width=32, font=("Segoe UI", 11))
-        self.to_base.set("2 (Binary)")
-        self.to_base.grid(row=2, column=1, padx=10, pady=10, sticky="ew")
-        
-        input_container.columnconfigure(1, weight=1)
-        
-        # Convert button
-        btn_frame = tk.Frame(input_card, bg='white')
-        btn_frame.pack(pady=15)
-        convert_btn = ModernButton(btn_frame, text="🔄 Convert", command=self.convert_number, 
-                                    bg=self.colors['primary'], fg="white", 
-                                    font=("Segoe UI", 12, "bold"), padx=40, pady=12,
-                                    relief=tk.RAISED, bd=0, cursor='hand2')
-        convert_btn.pack()
-        
-        # Output card
-        output_card = self.create_card_frame(frame, "📊 Result")
-        output_container = tk.Frame(output_card, bg='white')
-        output_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        self.num_result = scrolledtext.ScrolledText(
-            output_container, height=12, font=("Consolas", 11), wrap=tk.WORD,
-            bg='#fafafa', fg='#2c3e50', relief=tk.FLAT, bd=0, padx=15, pady=15,
-            highlightthickness=1, highlightbackground='#ddd'
+        self._build_io_tab(
+            frame, "📥 Input",
+            [("Number:", "num_input", None, ""),
+             ("From Base:", "from_base", BASE_CHOICES, "10 (Decimal)"),
+             ("To Base:", "to_base", BASE_CHOICES, "2 (Binary)")],
+            [("🔄 Convert", self.convert_number, self.colors['primary'])],
+            "num_result",
+            button_style={'font': ("Segoe UI", 12, "bold"), 'padx': 40}
         )
-        self.num_result.pack(fill=tk.BOTH, expand=True)
+        self.num_input.bind('<Return>', lambda e: self.convert_number())
     
-    def create_set_operations_tab(self):
+    def create_set_operations_tab(self, frame):
         """Create set operations tab."""
-        frame = ttk.Frame(self.notebook, padding=0)
-        self.notebook.add(frame, text="📊 Set Operations")
-        
-        # Input card
-        input_card = self.create_card_frame(frame, "📥 Input Sets")
-        input_container = tk.Frame(input_card, bg='white')
-        input_container.pack(fill=tk.X, padx=20, pady=15)
-        
-        tk.Label(input_container, text="Set A:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=0, column=0, padx=10, pady=10, sticky="w")
-        self.set_a_input = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
-                                    relief=tk.SOLID, bd=1, highlightthickness=2,
-                                    highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.set_a_input.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.set_a_input.insert(0, "1, 2, 3")
-        
-        tk.Label(input_container, text="Set B:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=1, column=0, padx=10, pady=10, sticky="w")
-        self.set_b_input = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
-                                    relief=tk.SOLID, bd=1, highlightthickness=2,
-                                    highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.set_b_input.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-        self.set_b_input.insert(0, "2, 3, 4")
-        
-        input_container.columnconfigure(1, weight=1)
-        
-        # Operations buttons
-        ops_frame = tk.Frame(input_card, bg='white')
-        ops_frame.pack(pady=20)
-        
         buttons = [
             ("Union (A ∪ B)", "union", self.colors['success']),
             ("Intersection (A ∩ B)", "intersection", self.colors['danger']),
             ("Difference (A - B)", "difference", self.colors['warning']),
             ("Cardinality", "cardinality", self.colors['purple'])
         ]
-        
-        for text, op, color in buttons:
-            btn = ModernButton(ops_frame, text=text, command=lambda o=op: self.perform_set_op(o),
-                              bg=color, fg="white", font=("Segoe UI", 10, "bold"),
-                              padx=15, pady=10, relief=tk.RAISED, bd=0, cursor='hand2')
-            btn.pack(side=tk.LEFT, padx=8)
-        
-        # Output card
-        output_card = self.create_card_frame(frame, "📊 Result")
-        output_container = tk.Frame(output_card, bg='white')
-        output_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        self.set_result = scrolledtext.ScrolledText(
-            output_container, height=12, font=("Consolas", 11), wrap=tk.WORD,
-            bg='#fafafa', fg='#2c3e50', relief=tk.FLAT, bd=0, padx=15, pady=15,
-            highlightthickness=1, highlightbackground='#ddd'
+        self._build_io_tab(
+            frame, "📥 Input Sets",
+            [("Set A:", "set_a_input", None, "1, 2, 3"),
+             ("Set B:", "set_b_input", None, "2, 3, 4")],
+            [(text, lambda o=op: self.perform_set_op(o), color) for text, op, color in buttons],
+            "set_result",
+            button_style={'font': ("Segoe UI", 10, "bold"), 'padx': 15, 'pady': 10},
+            button_spacing=8
         )
-        self.set_result.pack(fill=tk.BOTH, expand=True)
     
-    def create_searching_tab(self):
+    def create_searching_tab(self, frame):
         """Create searching algorithms tab."""
-        frame = ttk.Frame(self.notebook, padding=0)
-        self.notebook.add(frame, text="🔍 Searching")
-        
-        # Input card
-        input_card = self.create_card_frame(frame, "📥 Input")
-        input_container = tk.Frame(input_card, bg='white')
-        input_container.pack(fill=tk.X, padx=20, pady=15)
-        
-        tk.Label(input_container, text="Array:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=0, column=0, padx=10, pady=10, sticky="w")
-        self.search_array_input = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
-                                           relief=tk.SOLID, bd=1, highlightthickness=2,
-                                           highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.search_array_input.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.search_array_input.insert(0, "2, 5, 8, 12, 16, 23, 38, 45, 56")
-        
-        tk.Label(input_container, text="Target:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=1, column=0, padx=10, pady=10, sticky="w")
-        self.target_input = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
-                                     relief=tk.SOLID, bd=1, highlightthickness=2,
-                                     highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.target_input.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-        self.target_input.insert(0, "23")
-        
-        input_container.columnconfigure(1, weight=1)
-        
-        # Search buttons
-        search_frame = tk.Frame(input_card, bg='white')
-        search_frame.pack(pady=20)
-        
-        linear_btn = ModernButton(search_frame, text="🔎 Linear Search", 
-                                 command=lambda: self.perform_search("linear"),
-                                 bg=self.colors['info'], fg="white", 
-                                 font=("Segoe UI", 11, "bold"), padx=25, pady=12,
-                                 relief=tk.RAISED, bd=0, cursor='hand2')
-        linear_btn.pack(side=tk.LEFT, padx=10)
-        
-        binary_btn = ModernButton(search_frame, text="🎯 Binary Search", 
-                                 command=lambda: self.perform_search("binary"),
-                                 bg=self.colors['warning'], fg="white", 
-                                 font=("Segoe UI", 11, "bold"), padx=25, pady=12,
-                                 relief=tk.RAISED, bd=0, cursor='hand2')
-        binary_btn.pack(side=tk.LEFT, padx=10)
-        
-        # Output card
-        output_card = self.create_card_frame(frame, "📊 Result")
-        output_container = tk.Frame(output_card, bg='white')
-        output_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        self.search_result = scrolledtext.ScrolledText(
-            output_container, height=12, font=("Consolas", 11), wrap=tk.WORD,
-            bg='#fafafa', fg='#2c3e50', relief=tk.FLAT, bd=0, padx=15, pady=15,
-            highlightthickness=1, highlightbackground='#ddd'
+        self._build_io_tab(
+            frame, "📥 Input",
+            [("Array:", "search_array_input", None, "2, 5, 8, 12, 16, 23, 38, 45, 56"),
+             ("Target:", "target_input", None, "23")],
+            [("🔎 Linear Search", lambda: self.perform_search("linear"), self.colors['info']),
+             ("🎯 Binary Search", lambda: self.perform_search("binary"), self.colors['warning'])],
+            "search_result",
+            button_style={'padx': 25},
+            fast_mode_attr="search_fast_mode"
         )
-        self.search_result.pack(fill=tk.BOTH, expand=True)
     
-    def create_sorting_tab(self):
+    def create_sorting_tab(self, frame):
         """Create sorting algorithms tab."""
-        frame = ttk.Frame(self.notebook, padding=0)
-        self.notebook.add(frame, text="🔄 Sorting")
-        
+        buttons = [
+            ("🫧 Bubble Sort", "bubble", self.colors['danger']),
+            ("🎯 Selection Sort", "selection", self.colors['success']),
+            ("📥 Insertion Sort", "insertion", self.colors['purple'])
+        ]
+        self._build_io_tab(
+            frame, "📥 Input",
+            [("Array:", "sort_array_input", None, "64, 34, 25, 12, 22, 11, 90")],
+            [(text, lambda a=algo: self.perform_sort(a), color) for text, algo, color in buttons],
+            "sort_result",
+            fast_mode_attr="sort_fast_mode"
+        )
+    
+    def _build_io_tab(self, frame, input_title, input_rows, buttons, result_attr,
+                      button_style=None, button_spacing=10, fast_mode_attr=None):
+        """
+        Build an input card, a button row, and a result card inside a tab.
+        
+        Args:
+            frame: Tab frame to build into
+            input_title: Title of the input card
+            input_rows: (label, attr, choices, default) tuples; rows with
+                choices of None are entries, others are readonly comboboxes
+            buttons: (text, command, color) tuples
+            result_attr: Attribute name for the result text widget
+            button_style: ModernButton options overriding the defaults
+            button_spacing: Horizontal gap between buttons
+            fast_mode_attr: Attribute name for an optional fast mode flag
+        """
         # Input card
-        input_card = self.create_card_frame(frame, "📥 Input")
+        input_card = self.create_card_frame(frame, input_title)
         input_container = tk.Frame(input_card, bg='white')
         input_container.pack(fill=tk.X, padx=20, pady=15)
         
-        tk.Label(input_container, text="Array:", font=("Segoe UI", 11, "bold"), 
-                bg='white', fg=self.colors['dark']).grid(row=0, column=0, padx=10, pady=10, sticky="w")
-        self.sort_array_input = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
-                                        relief=tk.SOLID, bd=1, highlightthickness=2,
-                                        highlightcolor=self.colors['primary'], highlightbackground='#ddd')
-        self.sort_array_input.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.sort_array_input.insert(0, "64, 34, 25, 12, 22, 11, 90")
+        for row, (label, attr, choices, default) in enumerate(input_rows):
+            tk.Label(input_container, text=label, font=("Segoe UI", 11, "bold"), 
+                    bg='white', fg=self.colors['dark']).grid(row=row, column=0, padx=10, pady=10, sticky="w")
+            if choices is None:
+                widget = tk.Entry(input_container, font=("Segoe UI", 11), width=40,
+                                  relief=tk.SOLID, bd=1, highlightthickness=2,
+                                  highlightcolor=self.colors['primary'], highlightbackground='#ddd')
+                widget.insert(0, default)
+            else:
+                widget = ttk.Combobox(input_container, values=choices, 
+                                      state="readonly", width=32, font=("Segoe UI", 11))
+                widget.set(default)
+            widget.grid(row=row, column=1, padx=10, pady=10, sticky="ew")
+            setattr(self, attr, widget)
         
         input_container.columnconfigure(1, weight=1)
         
-        # Sort buttons
-        sort_frame = tk.Frame(input_card, bg='white')
-        sort_frame.pack(pady=20)
-        
-        buttons = [
-            ("🫧 Bubble Sort", "bubble", self.colors['danger']),
-            ("🎯 Selection Sort", "selection", self.colors['success']),
-            ("📥 Insertion Sort", "insertion", self.colors['purple'])
-        ]
-        
-        for text, algo, color in buttons:
-            btn = ModernButton(sort_frame, text=text, command=lambda a=algo: self.perform_sort(a),
-                              bg=color, fg="white", font=("Segoe UI", 11, "bold"),
-                              padx=20, pady=12, relief=tk.RAISED, bd=0, cursor='hand2')
-            btn.pack(side=tk.LEFT, padx=10)
+        # Action buttons
+        button_frame = tk.Frame(input_card, bg='white')
+        button_frame.pack(pady=20)
+        
+        style = {'font': ("Segoe UI", 11, "bold"), 'padx': 20, 'pady': 12}
+        style.update(button_style or {})
+        for text, command, color in buttons:
+            btn = ModernButton(button_frame, text=text, command=command,
+                              bg=color, fg="white", relief=tk.RAISED, bd=0,
+                              cursor='hand2', **style)
+            btn.pack(side=tk.LEFT, padx=button_spacing)
+        
+        if fast_mode_attr:
+            fast_mode = tk.BooleanVar(value=False)
+            tk.Checkbutton(input_card, text="⚡ Fast mode (no steps)", variable=fast_mode,
+                           font=("Segoe UI", 10), bg='white', fg=self.colors['dark'],
+                           activebackground='white').pack(pady=(0, 15))
+            setattr(self, fast_mode_attr, fast_mode)
         
         # Output card
         output_card = self.create_card_frame(frame, "📊 Result")
         output_container = tk.Frame(output_card, bg='white')
         output_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        self.sort_result = scrolledtext.ScrolledText(
+        result = scrolledtext.ScrolledText(
             output_container, height=12, font=("Consolas", 11), wrap=tk.WORD,
             bg='#fafafa', fg='#2c3e50', relief=tk.FLAT, bd=0, padx=15, pady=15,
-            highlightthickness=1, highlightbackground='#ddd'
+            highlightthickness=1, highlightbackground='#ddd',
+            undo=False, autoseparators=False, maxundo=0, state='disabled'
         )
-        self.sort_result.pack(fill=tk.BOTH, expand=True)
+        result.pack(fill=tk.BOTH, expand=True)
+        setattr(self, result_attr, result)
     
-    def animate_text(self, widget, text, delay=30):
-        """Animate text insertion."""
+    def show_result(self, widget, text):
+        """Replace the contents of a read-only result widget in one batch."""
+        widget.configure(state='normal')
         widget.delete(1.0, tk.END)
-        for i, char in enumerate(text):
-            widget.insert(tk.END, char)
-            if i % 10 == 0:
-                widget.update()
-                time.sleep(delay / 1000)
+        widget.insert('1.0', text)
+        widget.configure(state='disabled')
+        widget.see(tk.END)
+    
+    def animate_text(self, widget, text, delay=30, chunk_size=200):
+        """Animate text insertion in chunks scheduled on the Tk event loop."""
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.configure(state='disabled')
+        chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+        def insert_chunk(index=0):
+            if index < len(chunks):
+                widget.configure(state='normal')
+                widget.insert(tk.END, chunks[index])
+                widget.configure(state='disabled')
+                widget.after(delay, insert_chunk, index + 1)
+
+        insert_chunk()
     
     def convert_number(self):
         """Convert number between bases."""
+        if self.number_converter is None:
+            from number_systems import NumberSystemConverter
+            self.number_converter = NumberSystemConverter()
+        
         try:
             value = self.num_input.get().strip()
             from_base_str = self.from_base.get()
@@ -391,38 +409,38 @@ class DiscreteCalculatorApp:
                 return
             
             # Extract base numbers
-            base_map = {"2 (Binary)": 2, "8 (Octal)": 8, "10 (Decimal)": 10, "16 (Hexadecimal)": 16}
-            from_base = base_map[from_base_str]
-            to_base = base_map[to_base_str]
+            from_base = BASE_MAP[from_base_str]
+            to_base = BASE_MAP[to_base_str]
             
             result = self.number_converter.convert(value, from_base, to_base)
             
-            self.num_result.delete(1.0, tk.END)
-            output = f"╔════════════════════════════════════════╗\n"
-            output += f"║  NUMBER SYSTEM CONVERSION RESULT      ║\n"
-            output += f"╚════════════════════════════════════════╝\n\n"
-            output += f"📥 Input:  {value} (Base {from_base})\n"
-            output += f"📤 Output: {result} (Base {to_base})\n\n"
-            output += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            output += f"📊 All Conversions:\n"
-            output += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+            parts = []
+            parts.append(_CONV_HEADER)
+            parts.append(f"📥 Input:  {value} (Base {from_base})\n")
+            parts.append(f"📤 Output: {result} (Base {to_base})\n\n")
+            parts.append(_SEP)
+            parts.append(f"📊 All Conversions:\n")
+            parts.append(_SEP)
             
-            for base_name, base_num in base_map.items():
+            for base_name, base_num in BASE_MAP.items():
                 if base_num != from_base:
                     try:
                         conv_result = self.number_converter.convert(value, from_base, base_num)
-                        output += f"  • {base_name:20s} → {conv_result}\n"
+                        parts.append(f"  • {base_name:20s} → {conv_result}\n")
                     except:
                         pass
             
-            self.num_result.insert(tk.END, output)
-            self.num_result.see(tk.END)
+            self.show_result(self.num_result, "".join(parts))
         
         except Exception as e:
             messagebox.showerror("Error", f"Conversion failed: {str(e)}")
     
     def perform_set_op(self, operation):
         """Perform set operation."""
+        if self.set_ops is None:
+            from set_operations import SetOperations
+            self.set_ops = SetOperations()
+        
         try:
             set_a_str = self.set_a_input.get().strip()
             set_b_str = self.set_b_input.get().strip()
@@ -432,39 +450,41 @@ class DiscreteCalculatorApp:
                 return
             
             # Parse sets
-            set_a = set(item.strip() for item in set_a_str.split(",") if item.strip())
-            set_b = set(item.strip() for item in set_b_str.split(",") if item.strip()) if set_b_str else set()
+            set_a = {item for item in map(str.strip, set_a_str.split(",")) if item}
+            set_b = {item for item in map(str.strip, set_b_str.split(",")) if item}
             
-            self.set_result.delete(1.0, tk.END)
-            output = f"╔════════════════════════════════════════╗\n"
-            output += f"║      SET OPERATION RESULT              ║\n"
-            output += f"╚════════════════════════════════════════╝\n\n"
-            output += f"📊 Set A: {set_a}\n"
-            output += f"📊 Set B: {set_b}\n"
-            output += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+            parts = []
+            parts.append(_SET_HEADER)
+            parts.append(f"📊 Set A: {set_a}\n")
+            parts.append(f"📊 Set B: {set_b}\n")
+            parts.append(_SEP)
+            parts.append("\n")
             
             if operation == "union":
                 result = self.set_ops.union(set_a, set_b)
-                output += f"✅ Union (A ∪ B): {result}\n"
+                parts.append(f"✅ Union (A ∪ B): {result}\n")
             elif operation == "intersection":
                 result = self.set_ops.intersection(set_a, set_b)
-                output += f"✅ Intersection (A ∩ B): {result}\n"
+                parts.append(f"✅ Intersection (A ∩ B): {result}\n")
             elif operation == "difference":
                 result = self.set_ops.difference(set_a, set_b)
-                output += f"✅ Difference (A - B): {result}\n"
+                parts.append(f"✅ Difference (A - B): {result}\n")
             elif operation == "cardinality":
-                output += f"✅ Cardinality of A (|A|): {self.set_ops.cardinality(set_a)}\n"
+                parts.append(f"✅ Cardinality of A (|A|): {self.set_ops.cardinality(set_a)}\n")
                 if set_b:
-                    output += f"✅ Cardinality of B (|B|): {self.set_ops.cardinality(set_b)}\n"
+                    parts.append(f"✅ Cardinality of B (|B|): {self.set_ops.cardinality(set_b)}\n")
             
-            self.set_result.insert(tk.END, output)
-            self.set_result.see(tk.END)
+            self.show_result(self.set_result, "".join(parts))
         
         except Exception as e:
             messagebox.showerror("Error", f"Operation failed: {str(e)}")
     
     def perform_search(self, algorithm):
         """Perform search operation."""
+        if self.search_algo is None:
+            from searching import SearchingAlgorithms
+            self.search_algo = SearchingAlgorithms()
+        
         try:
             array_str = self.search_array_input.get().strip()
             target_str = self.target_input.get().strip()
@@ -476,58 +496,59 @@ class DiscreteCalculatorApp:
                 messagebox.showerror("Error", "Please enter a target value!")
                 return
             
-            # Parse array
-            try:
-                array = [int(x.strip()) for x in array_str.split(",") if x.strip()]
-            except ValueError:
-                array = [x.strip() for x in array_str.split(",") if x.strip()]
+            array = _parse_array(array_str)
             
-            # Parse target
-            try:
-                target = int(target_str.strip())
-            except ValueError:
-                target = target_str.strip()
+            target = int(target_str) if _is_int(target_str) else target_str
             
-            self.search_result.delete(1.0, tk.END)
-            output = f"╔════════════════════════════════════════╗\n"
-            output += f"║      SEARCH ALGORITHM RESULT          ║\n"
-            output += f"╚════════════════════════════════════════╝\n\n"
-            output += f"📊 Array:  {array}\n"
-            output += f"🎯 Target: {target}\n"
-            output += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+            parts = []
+            parts.append(_SEARCH_HEADER)
+            parts.append(f"📊 Array:  {array}\n")
+            parts.append(f"🎯 Target: {target}\n")
+            parts.append(_SEP)
+            parts.append("\n")
             
             if algorithm == "linear":
-                result, steps = self.search_algo.linear_search(array, target)
-                output += f"🔎 Linear Search Result:\n"
+                if self.search_fast_mode.get():
+                    result, _ = self.search_algo.linear_search(array, target, trace=False)
+                    steps = ["Steps skipped in fast mode"]
+                else:
+                    result, steps = self.search_algo.linear_search(array, target)
+                parts.append(f"🔎 Linear Search Result:\n")
                 if result != -1:
-                    output += f"   ✅ Found at index: {result}\n\n"
+                    parts.append(f"   ✅ Found at index: {result}\n\n")
                 else:
-                    output += f"   ❌ Not found in array\n\n"
-                output += f"📝 Steps:\n"
-                for step in steps:
-                    output += f"   • {step}\n"
+                    parts.append(f"   ❌ Not found in array\n\n")
+                parts.append(f"📝 Steps:\n")
+                parts.extend(f"   • {step}\n" for step in steps)
             
             elif algorithm == "binary":
                 sorted_array = sorted(array)
-                output += f"📊 Sorted Array: {sorted_array}\n\n"
-                result, steps = self.search_algo.binary_search(sorted_array, target)
-                output += f"🎯 Binary Search Result:\n"
+                parts.append(f"📊 Sorted Array: {sorted_array}\n\n")
+                if self.search_fast_mode.get():
+                    result, _ = self.search_algo.binary_search(sorted_array, target, trace=False)
+                    steps = ["Steps skipped in fast mode"]
+                else:
+                    result, steps = self.search_algo.binary_search(sorted_array, target)
+                    steps = self.search_algo.render_binary_steps(steps)
+                parts.append(f"🎯 Binary Search Result:\n")
                 if result != -1:
-                    output += f"   ✅ Found at index: {result}\n\n"
+                    parts.append(f"   ✅ Found at index: {result}\n\n")
                 else:
-                    output += f"   ❌ Not found in array\n\n"
-                output += f"📝 Steps:\n"
-                for step in steps:
-                    output += f"   • {step}\n"
+                    parts.append(f"   ❌ Not found in array\n\n")
+                parts.append(f"📝 Steps:\n")
+                parts.extend(f"   • {step}\n" for step in steps)
             
-            self.search_result.insert(tk.END, output)
-            self.search_result.see(tk.END)
+            self.show_result(self.search_result, "".join(parts))
         
         except Exception as e:
             messagebox.showerror("Error", f"Search failed: {str(e)}")
     
     def perform_sort(self, algorithm):
         """Perform sort operation."""
+        if self.sort_algo is None:
+            from sorting import SortingAlgorithms
+            self.sort_algo = SortingAlgorithms()
+        
         try:
             array_str = self.sort_array_input.get().strip()
             
@@ -535,42 +556,41 @@ class DiscreteCalculatorApp:
                 messagebox.showerror("Error", "Please enter an array!")
                 return
             
-            # Parse array
-            try:
-                array = [int(x.strip()) for x in array_str.split(",") if x.strip()]
-            except ValueError:
-                array = [x.strip() for x in array_str.split(",") if x.strip()]
+            array = _parse_array(array_str)
+            
+            parts = []
+            parts.append(_SORT_HEADER)
+            parts.append(f"📥 Original Array: {array}\n")
+            parts.append(_SEP)
+            parts.append("\n")
             
-            self.sort_result.delete(1.0, tk.END)
-            output = f"╔════════════════════════════════════════╗\n"
-            output += f"║      SORTING ALGORITHM RESULT         ║\n"
-            output += f"╚════════════════════════════════════════╝\n\n"
-            output += f"📥 Original Array: {array}\n"
-            output += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+            if self.sort_fast_mode.get():
+                sorted_array = self.sort_algo.sort(array)
+                parts.append(f"⚡ Fast Sort Result: {sorted_array}\n\n")
+                parts.append(f"📝 Sorting steps skipped in fast mode\n")
             
-            if algorithm == "bubble":
-                sorted_array, steps = self.sort_algo.bubble_sort(array.copy())
-                output += f"🫧 Bubble Sort Result: {sorted_array}\n\n"
-                output += f"📝 Sorting Steps:\n"
-                for i, step in enumerate(steps, 1):
-                    output += f"   Step {i}: {step}\n"
+            elif algorithm == "bubble":
+                sorted_array, steps = self.sort_algo.bubble_sort(array)
+                render = functools.partial(self.sort_algo.render_steps, array, steps)
+                parts.append(f"🫧 Bubble Sort Result: {sorted_array}\n\n")
+                parts.append(f"📝 Sorting Steps:\n")
+                parts.extend(_numbered_steps(render, len(steps)))
             
             elif algorithm == "selection":
-                sorted_array, steps = self.sort_algo.selection_sort(array.copy())
-                output += f"🎯 Selection Sort Result: {sorted_array}\n\n"
-                output += f"📝 Sorting Steps:\n"
-                for i, step in enumerate(steps, 1):
-                    output += f"   Step {i}: {step}\n"
+                sorted_array, steps = self.sort_algo.selection_sort(array)
+                render = functools.partial(self.sort_algo.render_steps, array, steps)
+                parts.append(f"🎯 Selection Sort Result: {sorted_array}\n\n")
+                parts.append(f"📝 Sorting Steps:\n")
+                parts.extend(_numbered_steps(render, len(steps)))
             
             elif algorithm == "insertion":
-                sorted_array, steps = self.sort_algo.insertion_sort(array.copy())
-                output += f"📥 Insertion Sort Result: {sorted_array}\n\n"
-                output += f"📝 Sorting Steps:\n"
-                for i, step in enumerate(steps, 1):
-                    output += f"   Step {i}: {step}\n"
+                sorted_array, steps = self.sort_algo.insertion_sort(array)
+                render = functools.partial(self.sort_algo.render_steps, array, steps)
+                parts.append(f"📥 Insertion Sort Result: {sorted_array}\n\n")
+                parts.append(f"📝 Sorting Steps:\n")
+                parts.extend(_numbered_steps(render, len(steps)))
             
-            self.sort_result.insert(tk.END, output)
-            self.sort_result.see(tk.END)
+            self.show_result(self.sort_result, "".join(parts))
         
         except Exception as e:
             messagebox.showerror("Error", f"Sort failed: {str(e)}")
@@ -585,4 +605,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-                                                                                                     
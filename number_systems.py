@@ -3,6 +3,19 @@ Number Systems Module
 Handles conversions between Binary, Octal, Decimal, and Hexadecimal number systems.
 """
 
+# Valid digits per base, as bytes for bytes.translate
+_BINARY_DIGITS = b"01"
+_OCTAL_DIGITS = b"01234567"
+_HEX_DIGITS = b"0123456789ABCDEF"
+
+
+def _check_digits(digits, valid, name):
+    """Raise ValueError naming the first character of digits not in valid."""
+    # Deleting every valid byte leaves something only if a digit is invalid
+    if digits.encode().translate(None, valid):
+        invalid = next(digit for digit in digits if digit.encode() not in valid)
+        raise ValueError(f"Invalid {name} digit: {invalid}")
+
 
 class NumberSystemConverter:
     """Converts numbers between different number systems."""
@@ -10,38 +23,19 @@ class NumberSystemConverter:
     @staticmethod
     def decimal_to_binary(decimal):
         """Convert decimal to binary."""
-        if decimal == 0:
-            return "0"
-        binary = ""
-        num = abs(decimal)
-        while num > 0:
-            binary = str(num % 2) + binary
-            num //= 2
+        binary = bin(abs(decimal))[2:]
         return binary if decimal >= 0 else "-" + binary
     
     @staticmethod
     def decimal_to_octal(decimal):
         """Convert decimal to octal."""
-        if decimal == 0:
-            return "0"
-        octal = ""
-        num = abs(decimal)
-        while num > 0:
-            octal = str(num % 8) + octal
-            num //= 8
+        octal = oct(abs(decimal))[2:]
         return octal if decimal >= 0 else "-" + octal
     
     @staticmethod
     def decimal_to_hexadecimal(decimal):
         """Convert decimal to hexadecimal."""
-        if decimal == 0:
-            return "0"
-        hex_chars = "0123456789ABCDEF"
-        hexadecimal = ""
-        num = abs(decimal)
-        while num > 0:
-            hexadecimal = hex_chars[num % 16] + hexadecimal
-            num //= 16
+        hexadecimal = format(abs(decimal), "X")
         return hexadecimal if decimal >= 0 else "-" + hexadecimal
     
     @staticmethod
@@ -54,12 +48,8 @@ class NumberSystemConverter:
         else:
             sign = 1
         
-        decimal = 0
-        for i, digit in enumerate(reversed(binary)):
-            if digit not in "01":
-                raise ValueError(f"Invalid binary digit: {digit}")
-            decimal += int(digit) * (2 ** i)
-        return sign * decimal
+        _check_digits(binary, _BINARY_DIGITS, "binary")
+        return sign * int(binary or "0", 2)
     
     @staticmethod
     def octal_to_decimal(octal):
@@ -71,12 +61,8 @@ class NumberSystemConverter:
         else:
             sign = 1
         
-        decimal = 0
-        for i, digit in enumerate(reversed(octal)):
-            if digit not in "01234567":
-                raise ValueError(f"Invalid octal digit: {digit}")
-            decimal += int(digit) * (8 ** i)
-        return sign * decimal
+        _check_digits(octal, _OCTAL_DIGITS, "octal")
+        return sign * int(octal or "0", 8)
     
     @staticmethod
     def hexadecimal_to_decimal(hexadecimal):
@@ -88,13 +74,8 @@ class NumberSystemConverter:
         else:
             sign = 1
         
-        hex_chars = "0123456789ABCDEF"
-        decimal = 0
-        for i, char in enumerate(reversed(hexadecimal)):
-            if char not in hex_chars:
-                raise ValueError(f"Invalid hexadecimal digit: {char}")
-            decimal += hex_chars.index(char) * (16 ** i)
-        return sign * decimal
+        _check_digits(hexadecimal, _HEX_DIGITS, "hexadecimal")
+        return sign * int(hexadecimal or "0", 16)
     
     def convert(self, value, from_base, to_base):
         """
@@ -108,26 +89,27 @@ class NumberSystemConverter:
         Returns:
             Converted number as string
         """
-        # First convert to decimal
-        if from_base == 10:
-            decimal = int(value)
-        elif from_base == 2:
-            decimal = self.binary_to_decimal(value)
-        elif from_base == 8:
-            decimal = self.octal_to_decimal(value)
-        elif from_base == 16:
-            decimal = self.hexadecimal_to_decimal(value)
-        else:
+        to_decimal = _TO_DECIMAL.get(from_base)
+        if to_decimal is None:
             raise ValueError(f"Unsupported base: {from_base}")
+        decimal = to_decimal(value)
         
-        # Then convert from decimal to target base
-        if to_base == 10:
-            return str(decimal)
-        elif to_base == 2:
-            return self.decimal_to_binary(decimal)
-        elif to_base == 8:
-            return self.decimal_to_octal(decimal)
-        elif to_base == 16:
-            return self.decimal_to_hexadecimal(decimal)
-        else:
+        from_decimal = _FROM_DECIMAL.get(to_base)
+        if from_decimal is None:
             raise ValueError(f"Unsupported base: {to_base}")
+        return from_decimal(decimal)
+
+
+# Parsers and formatters used by convert(), keyed by base
+_TO_DECIMAL = {
+    2: NumberSystemConverter.binary_to_decimal,
+    8: NumberSystemConverter.octal_to_decimal,
+    10: int,
+    16: NumberSystemConverter.hexadecimal_to_decimal,
+}
+_FROM_DECIMAL = {
+    2: NumberSystemConverter.decimal_to_binary,
+    8: NumberSystemConverter.decimal_to_octal,
+    10: str,
+    16: NumberSystemConverter.decimal_to_hexadecimal,
+}
@@ -3,22 +3,33 @@ Searching Algorithms Module
 Implements Linear Search and Binary Search algorithms.
 """
 
+from bisect import bisect_left
+
 
 class SearchingAlgorithms:
     """Implements various searching algorithms."""
     
     @staticmethod
-    def linear_search(array, target):
+    def linear_search(array, target, trace=True):
         """
         Performs linear search on an array.
         
         Args:
             array: List to search in
             target: Value to search for
+            trace: Record the human-readable steps; when False the scan
+                runs in C via list.index
         
         Returns:
-            tuple: (index, steps) where index is -1 if not found
+            tuple: (index, steps) where index is -1 if not found and steps
+            is empty if trace is False
         """
+        if not trace:
+            try:
+                return array.index(target), []
+            except ValueError:
+                return -1, []
+        
         steps = []
         for i, element in enumerate(array):
             steps.append(f"Checking index {i}: {element} {'=' if element == target else '≠'} {target}")
@@ -29,40 +40,72 @@ class SearchingAlgorithms:
         return -1, steps
     
     @staticmethod
-    def binary_search(array, target):
+    def binary_search(array, target, trace=True):
         """
         Performs binary search on a sorted array.
         
         Args:
             array: Sorted list to search in
             target: Value to search for
+            trace: Record the search steps; when False the search runs
+                in C via bisect.bisect_left
         
         Returns:
-            tuple: (index, steps) where index is -1 if not found
+            tuple: (index, steps) where index is -1 if not found and steps
+            are step tuples for render_binary_steps, empty if trace is False
         """
+        if not trace:
+            index = bisect_left(array, target)
+            found = index < len(array) and array[index] == target
+            return (index if found else -1), []
+        
         steps = []
         left = 0
         right = len(array) - 1
-        step_num = 1
         
         while left <= right:
             mid = (left + right) // 2
             mid_value = array[mid]
             
-            steps.append(f"Step {step_num}: Checking middle element at index {mid} = {mid_value}")
+            steps.append(("mid", mid, mid_value))
             
             if mid_value == target:
-                steps.append(f"✓ Found at index {mid}!")
+                steps.append(("found", mid))
                 return mid, steps
             elif mid_value < target:
-                steps.append(f"  {mid_value} < {target}, searching right half [{mid+1}..{right}]")
+                steps.append(("right", mid_value, target, mid + 1, right))
                 left = mid + 1
             else:
-                steps.append(f"  {mid_value} > {target}, searching left half [{left}..{mid-1}]")
+                steps.append(("left", mid_value, target, left, mid - 1))
                 right = mid - 1
-            
-            step_num += 1
         
-        steps.append("✗ Target not found in array")
+        steps.append(("not_found",))
         return -1, steps
-
+    
+    @staticmethod
+    def render_binary_steps(steps):
+        """
+        Renders recorded binary search steps as human-readable text.
+        
+        Args:
+            steps: Step tuples returned by binary_search
+        
+        Yields:
+            str: Description of each step
+        """
+        step_num = 0
+        for kind, *args in steps:
+            if kind == "mid":
+                step_num += 1
+                mid, mid_value = args
+                yield f"Step {step_num}: Checking middle element at index {mid} = {mid_value}"
+            elif kind == "right":
+                mid_value, target, left, right = args
+                yield f"  {mid_value} < {target}, searching right half [{left}..{right}]"
+            elif kind == "left":
+                mid_value, target, left, right = args
+                yield f"  {mid_value} > {target}, searching left half [{left}..{right}]"
+            elif kind == "found":
+                yield f"✓ Found at index {args[0]}!"
+            elif kind == "not_found":
+                yield "✗ Target not found in array"
@@ -3,10 +3,105 @@ Set Operations Module
 Handles set theory operations: Union, Intersection, Difference, and Cardinality.
 """
 
+from bisect import bisect_left
+
+
+class BitSet:
+    """
+    Set of non-negative integers stored as the bits of one Python int.
+    Union, intersection and difference are single big-integer bitwise
+    operations, so dense integer sets combine much faster than a set.
+    """
+    
+    __hash__ = None
+    
+    def __init__(self, bits=0):
+        self.bits = bits
+    
+    def __or__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return BitSet(self.bits | other.bits)
+    
+    def __and__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return BitSet(self.bits & other.bits)
+    
+    def __sub__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return BitSet(self.bits & ~other.bits)
+    
+    def __ior__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        self.bits |= other.bits
+        return self
+    
+    def __iand__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        self.bits &= other.bits
+        return self
+    
+    def __isub__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        self.bits &= ~other.bits
+        return self
+    
+    def __eq__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self.bits == other.bits
+    
+    def __len__(self):
+        return bin(self.bits).count("1")
+    
+    def __bool__(self):
+        return self.bits != 0
+    
+    def __contains__(self, value):
+        return isinstance(value, int) and value >= 0 and (self.bits >> value) & 1 == 1
+    
+    def __iter__(self):
+        data = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little")
+        for offset, byte in enumerate(data):
+            if byte:
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        yield offset * 8 + bit
+    
+    def __repr__(self):
+        return f"BitSet({{{', '.join(map(str, self))}}})" if self.bits else "BitSet()"
+    
+    def copy(self):
+        """Returns a shallow copy of the bit set."""
+        return BitSet(self.bits)
+
 
 class SetOperations:
     """Performs various set operations."""
     
+    @staticmethod
+    def from_integers(values):
+        """
+        Returns a BitSet holding the given non-negative integers.
+        Union, intersection, difference and cardinality accept BitSets
+        as well as regular sets.
+        """
+        values = list(values)
+        for value in values:
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f"BitSet elements must be non-negative integers: {value!r}")
+        if not values:
+            return BitSet()
+        data = bytearray(max(values) // 8 + 1)
+        for value in values:
+            data[value >> 3] |= 1 << (value & 7)
+        return BitSet(int.from_bytes(data, "little"))
+    
     @staticmethod
     def union(set_a, set_b):
         """
@@ -23,6 +118,41 @@ class SetOperations:
         """
         return set_a & set_b
     
+    @staticmethod
+    def intersection_sorted(list_a, list_b):
+        """
+        Returns the intersection of two sorted lists as a sorted list.
+        When one list is much shorter, each of its elements is located
+        in the longer one by binary search; otherwise both lists are
+        merged with two pointers. Inputs must already be sorted.
+        """
+        if len(list_a) > len(list_b):
+            list_a, list_b = list_b, list_a
+        result = []
+        
+        if len(list_a) * 16 < len(list_b):
+            lo = 0
+            for value in list_a:
+                lo = bisect_left(list_b, value, lo)
+                if lo == len(list_b):
+                    break
+                if list_b[lo] == value:
+                    result.append(value)
+                    lo += 1
+            return result
+        
+        i = j = 0
+        while i < len(list_a) and j < len(list_b):
+            if list_a[i] < list_b[j]:
+                i += 1
+            elif list_b[j] < list_a[i]:
+                j += 1
+            else:
+                result.append(list_a[i])
+                i += 1
+                j += 1
+        return result
+    
     @staticmethod
     def difference(set_a, set_b):
         """
@@ -31,6 +161,38 @@ class SetOperations:
         """
         return set_a - set_b
     
+    @staticmethod
+    def union_many(sets):
+        """
+        Returns the union of any number of sets (A ∪ B ∪ ...).
+        Grows a copy of the largest set in place instead of building
+        an intermediate set for every pair.
+        """
+        sets = sorted(sets, key=len, reverse=True)
+        if not sets:
+            return set()
+        result = sets[0].copy()
+        for other in sets[1:]:
+            result |= other
+        return result
+    
+    @staticmethod
+    def intersection_many(sets):
+        """
+        Returns the intersection of any number of sets (A ∩ B ∩ ...).
+        Shrinks a copy of the smallest set in place and stops early
+        once it is empty. An empty collection of sets gives an empty set.
+        """
+        sets = sorted(sets, key=len)
+        if not sets:
+            return set()
+        result = sets[0].copy()
+        for other in sets[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+    
     @staticmethod
     def cardinality(set_a):
         """
@@ -3,107 +3,270 @@ Sorting Algorithms Module
 Implements Bubble Sort, Selection Sort, and Insertion Sort algorithms.
 """
 
+from bisect import bisect_right
+
+
+def _bubble_kernel(arr):
+    """Bubble sort arr in place without recording steps."""
+    n = len(arr)
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        if not swapped:
+            break
+
+
+def _selection_kernel(arr):
+    """Selection sort arr in place without recording steps."""
+    n = len(arr)
+    for i in range(n):
+        min_idx = arr.index(min(arr[i:]), i)
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+
+
+def _insertion_kernel(arr):
+    """Insertion sort arr in place without recording steps."""
+    for i in range(1, len(arr)):
+        key = arr[i]
+        # After equal keys, matching the strict > of the traced version
+        pos = bisect_right(arr, key, 0, i)
+        if pos != i:
+            # del/insert shift arr[pos:i] with a C-level memmove
+            del arr[i]
+            arr.insert(pos, key)
+
+
+# Step-free kernels selectable through SortingAlgorithms.sort
+_KERNELS = {
+    "bubble": _bubble_kernel,
+    "selection": _selection_kernel,
+    "insertion": _insertion_kernel,
+}
+
 
 class SortingAlgorithms:
     """Implements various sorting algorithms."""
     
     @staticmethod
-    def bubble_sort(array):
+    def sort(array, prefer="auto"):
+        """
+        Sorts an array without recording steps.
+        
+        Args:
+            array: List to sort
+            prefer: "auto" for Python's built-in Timsort, which is the
+                fastest choice at every size, or "bubble", "selection" or
+                "insertion" to run that algorithm's kernel
+        
+        Returns:
+            list: New sorted list
+        """
+        if prefer == "auto":
+            return sorted(array)
+        kernel = _KERNELS.get(prefer)
+        if kernel is None:
+            raise ValueError(f"Unsupported sort: {prefer}")
+        arr = array.copy()
+        kernel(arr)
+        return arr
+    
+    @staticmethod
+    def bubble_sort(array, trace=True, fast=False):
         """
         Performs bubble sort on an array.
         
         Args:
             array: List to sort
+            trace: Record the sorting steps (slower on large arrays)
+            fast: Use Python's built-in Timsort instead, bypassing the
+                bubble sort algorithm and its step recording
         
         Returns:
-            tuple: (sorted_array, steps)
+            tuple: (sorted_array, steps) where steps are step tuples for
+            render_steps, empty if trace is False or fast is True
         """
+        if fast:
+            return sorted(array), []
+        
         arr = array.copy()
+        if not trace:
+            _bubble_kernel(arr)
+            return arr, []
+        
         n = len(arr)
-        steps = []
-        steps.append(f"Starting array: {arr}")
+        steps = [("start",)]
         
         for i in range(n):
             swapped = False
-            steps.append(f"\nPass {i + 1}:")
+            steps.append(("bubble_pass", i))
             for j in range(0, n - i - 1):
                 if arr[j] > arr[j + 1]:
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
                     swapped = True
-                    steps.append(f"  Swapped {arr[j+1]} and {arr[j]}: {arr}")
+                    steps.append(("bubble_swap", j))
             
             if not swapped:
-                steps.append("  No swaps needed, array is sorted")
+                steps.append(("no_swaps",))
                 break
         
-        steps.append(f"\nFinal sorted array: {arr}")
+        steps.append(("done",))
         return arr, steps
     
     @staticmethod
-    def selection_sort(array):
+    def selection_sort(array, trace=True, fast=False):
         """
         Performs selection sort on an array.
         
         Args:
             array: List to sort
+            trace: Record the sorting steps (slower on large arrays)
+            fast: Use Python's built-in Timsort instead, bypassing the
+                selection sort algorithm and its step recording
         
         Returns:
-            tuple: (sorted_array, steps)
+            tuple: (sorted_array, steps) where steps are step tuples for
+            render_steps, empty if trace is False or fast is True
         """
+        if fast:
+            return sorted(array), []
+        
         arr = array.copy()
+        if not trace:
+            _selection_kernel(arr)
+            return arr, []
+        
         n = len(arr)
-        steps = []
-        steps.append(f"Starting array: {arr}")
+        steps = [("start",)]
         
         for i in range(n):
-            min_idx = i
-            steps.append(f"\nPass {i + 1}: Finding minimum from index {i} to {n-1}")
+            steps.append(("selection_pass", i))
             
-            for j in range(i + 1, n):
-                if arr[j] < arr[min_idx]:
-                    min_idx = j
+            # min() and index() both run in C; index() returns the first
+            # of equal minima, like a strict < scan
+            min_idx = arr.index(min(arr[i:]), i)
             
             if min_idx != i:
                 arr[i], arr[min_idx] = arr[min_idx], arr[i]
-                steps.append(f"  Swapped {arr[i]} (min) with {arr[min_idx]}: {arr}")
+                steps.append(("min_swap", i, min_idx))
             else:
-                steps.append(f"  {arr[i]} is already in correct position")
+                steps.append(("in_place", i))
         
-        steps.append(f"\nFinal sorted array: {arr}")
+        steps.append(("done",))
         return arr, steps
     
     @staticmethod
-    def insertion_sort(array):
+    def insertion_sort(array, trace=True, fast=False):
         """
         Performs insertion sort on an array.
         
         Args:
             array: List to sort
+            trace: Record the sorting steps (slower on large arrays)
+            fast: Use Python's built-in Timsort instead, bypassing the
+                insertion sort algorithm and its step recording
         
         Returns:
-            tuple: (sorted_array, steps)
+            tuple: (sorted_array, steps) where steps are step tuples for
+            render_steps, empty if trace is False or fast is True
         """
+        if fast:
+            return sorted(array), []
+        
         arr = array.copy()
+        if not trace:
+            _insertion_kernel(arr)
+            return arr, []
+        
         n = len(arr)
-        steps = []
-        steps.append(f"Starting array: {arr}")
+        steps = [("start",)]
         
         for i in range(1, n):
             key = arr[i]
             j = i - 1
-            steps.append(f"\nPass {i}: Inserting {key} into sorted portion")
+            steps.append(("insert_pass", i))
             
             while j >= 0 and arr[j] > key:
                 arr[j + 1] = arr[j]
+                steps.append(("shift", j))
                 j -= 1
-                steps.append(f"  Shifted {arr[j+1]} to the right: {arr}")
             
             arr[j + 1] = key
             if j + 1 != i:
-                steps.append(f"  Inserted {key} at position {j + 1}: {arr}")
+                steps.append(("insert", j + 1))
             else:
-                steps.append(f"  {key} is already in correct position")
+                steps.append(("in_place", i))
         
-        steps.append(f"\nFinal sorted array: {arr}")
+        steps.append(("done",))
         return arr, steps
-
+    
+    @staticmethod
+    def render_steps(array, steps, start=0, stop=None):
+        """
+        Renders recorded sorting steps as human-readable text.
+        
+        Steps are replayed on a copy of the original array, so only the
+        steps in [start, stop) pay for formatting the array snapshot.
+        
+        Args:
+            array: The unsorted list the steps were recorded for
+            steps: Step tuples returned by one of the sorting methods
+            start: Index of the first step to render
+            stop: Index after the last step to render (default: all)
+        
+        Yields:
+            str: Description of each step in the requested range
+        """
+        arr = list(array)
+        n = len(arr)
+        key = None
+        if stop is None:
+            stop = len(steps)
+        
+        for index, (kind, *args) in enumerate(steps[:stop]):
+            # Replay the step so later snapshots show the right array
+            if kind == "bubble_swap":
+                j = args[0]
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+            elif kind == "min_swap":
+                i, min_idx = args
+                arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            elif kind == "insert_pass":
+                key = arr[args[0]]
+            elif kind == "shift":
+                j = args[0]
+                arr[j + 1] = arr[j]
+            elif kind == "insert":
+                arr[args[0]] = key
+            
+            if index < start:
+                continue
+            
+            if kind == "start":
+                yield f"Starting array: {arr}"
+            elif kind == "bubble_pass":
+                yield f"\nPass {args[0] + 1}:"
+            elif kind == "bubble_swap":
+                j = args[0]
+                yield f"  Swapped {arr[j+1]} and {arr[j]}: {arr}"
+            elif kind == "no_swaps":
+                yield "  No swaps needed, array is sorted"
+            elif kind == "selection_pass":
+                i = args[0]
+                yield f"\nPass {i + 1}: Finding minimum from index {i} to {n-1}"
+            elif kind == "min_swap":
+                i, min_idx = args
+                yield f"  Swapped {arr[i]} (min) with {arr[min_idx]}: {arr}"
+            elif kind == "in_place":
+                yield f"  {arr[args[0]]} is already in correct position"
+            elif kind == "insert_pass":
+                yield f"\nPass {args[0]}: Inserting {key} into sorted portion"
+            elif kind == "shift":
+                yield f"  Shifted {arr[args[0] + 1]} to the right: {arr}"
+            elif kind == "insert":
+                yield f"  Inserted {key} at position {args[0]}: {arr}"
+            elif kind == "done":
+                yield f"\nFinal sorted array: {arr}"